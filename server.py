@@ -12,17 +12,35 @@ import os
 import urllib.request
 import urllib.parse
 import http.client
+import gzip
+import functools
 
 PORT = 8765
 FILE_WATCHER_PORT = 8767
 
+# Text assets worth compressing (example logs are several MB of repetitive text)
+GZIP_EXTENSIONS = ('.txt', '.log', '.js', '.css', '.html', '.json')
+GZIP_MIN_SIZE = 1024
+
+@functools.lru_cache(maxsize=32)
+def gzip_file_contents(path, mtime, size):
+    """Compress a file once per version. mtime and size are part of the cache key
+    so an edited file is recompressed instead of serving stale bytes."""
+    with open(path, 'rb') as f:
+        # Level 1 is cheap on CPU and still shrinks log text several times over
+        return gzip.compress(f.read(), compresslevel=1)
+
 class CustomHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
         # CORS headers for file watcher API
         if self.path.startswith('/api/file-watcher'):
+            self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        else:
+            # Static files may be cached but must be revalidated, so unchanged
+            # assets come back as 304 via Last-Modified instead of a full re-download
+            self.send_header('Cache-Control', 'no-cache')
         super().end_headers()
 
     def do_OPTIONS(self):
@@ -127,8 +145,42 @@ class CustomHandler(http.server.SimpleHTTPRequestHandler):
                 return
         
         # Handle regular file requests
+        if self.send_gzipped_file():
+            return
         super().do_GET()
 
+    def send_gzipped_file(self):
+        """Serve a compressible static file gzipped if the browser accepts it.
+        Returns False to fall back to the default handler."""
+        if 'gzip' not in self.headers.get('Accept-Encoding', ''):
+            return False
+
+        path = self.translate_path(self.path)
+        if not path.endswith(GZIP_EXTENSIONS) or not os.path.isfile(path):
+            return False
+
+        stat = os.stat(path)
+        if stat.st_size < GZIP_MIN_SIZE:
+            return False
+
+        last_modified = self.date_time_string(stat.st_mtime)
+        if self.headers.get('If-Modified-Since') == last_modified:
+            self.send_response(304)
+            self.end_headers()
+            return True
+
+        body = gzip_file_contents(path, stat.st_mtime, stat.st_size)
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
     def guess_type(self, path):
         mimetype = super().guess_type(path)
         if path.endswith('.js'):
@@ -137,17 +189,29 @@ class CustomHandler(http.server.SimpleHTTPRequestHandler):
             return 'text/css'
         return mimetype
 
+class ReusableTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    # Allow an immediate restart after Ctrl+C instead of waiting for the old
+    # socket to leave TIME_WAIT and hold the port
+    allow_reuse_address = True
+    # Serve each request on its own thread so a long-lived SSE proxy stream or a
+    # large log download doesn't stall every other request; daemon threads let
+    # Ctrl+C exit without waiting on open connections
+    daemon_threads = True
+
 def main():
     # Change to script directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
     try:
-        with socketserver.TCPServer(("", PORT), CustomHandler) as httpd:
+        with ReusableTCPServer(("", PORT), CustomHandler) as httpd:
             url = f"http://localhost:{PORT}/index.html"
             print(f"Starting server at {url}")
             print("Press Ctrl+C to stop")
             webbrowser.open(url)
-            httpd.serve_forever()
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                print("\nStopping server")
     except OSError as e:
         if "Address already in use" in str(e):
             print(f"Port {PORT} is already in use. Using existing server...")
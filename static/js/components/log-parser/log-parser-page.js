@@ -873,32 +873,26 @@ async function handleFileSelect(event) {
         // Track processing state for time estimation
         let processingStartTime = null;
 
-        // Create parser instance
-        const progressCallback = (message) => {
-            // Check if this is a reading progress message (don't add to log, just update progress bar)
-            const readingMatch = message.match(/Reading:\s*([\d.]+)%\s*\(([\d,]+)\s+lines read\)/i);
-            if (readingMatch) {
-                const percent = parseFloat(readingMatch[1]);
-                const linesRead = parseInt(readingMatch[2].replace(/,/g, ''), 10);
-
-                // Calculate estimated time remaining
-                if (!window.readingStartTime) {
-                    window.readingStartTime = Date.now();
-                    processingStartTime = Date.now();
-                }
-
-                let estimatedTimeRemaining = null;
-                if (percent > 0) {
-                    const elapsed = (Date.now() - window.readingStartTime) / 1000; // seconds
-                    const totalTime = (elapsed / percent) * 100;
-                    estimatedTimeRemaining = Math.max(0, totalTime - elapsed);
-                }
+        // Reading progress arrives as numbers, so it updates the progress bar without going through the message log
+        const readProgressCallback = (percent, linesRead) => {
+            // Calculate estimated time remaining
+            if (!window.readingStartTime) {
+                window.readingStartTime = Date.now();
+                processingStartTime = Date.now();
+            }
 
-                updateProgressBar('processing', 'Processing log file', percent, estimatedTimeRemaining);
-                // Don't add reading progress messages to the log
-                return;
+            let estimatedTimeRemaining = null;
+            if (percent > 0) {
+                const elapsed = (Date.now() - window.readingStartTime) / 1000; // seconds
+                const totalTime = (elapsed / percent) * 100;
+                estimatedTimeRemaining = Math.max(0, totalTime - elapsed);
             }
 
+            updateProgressBar('processing', 'Processing log file', percent, estimatedTimeRemaining);
+        };
+
+        // Create parser instance
+        const progressCallback = (message) => {
             // Also check for initial reading message
             if (message.includes('Reading log file') && !message.includes('Reading:')) {
                 updateProgressBar('processing', 'Processing log file', 0, null);
@@ -946,7 +940,7 @@ async function handleFileSelect(event) {
 
         // Dynamically import the parser module (ES modules load async)
         const { UnityLogParser } = await import('../../parser/log-parser.js');
-        const parser = new UnityLogParser(db, progressCallback);
+        const parser = new UnityLogParser(db, progressCallback, readProgressCallback);
 
         // Storage progress callback for database operations
         const storageProgressCallback = (phaseId, phaseLabel, percent, estimatedTimeRemaining) => {
@@ -69,9 +69,14 @@ async function displayCacheServerBlocks() {
         
         // Calculate total stats
         const totalBlocks = blocks.length;
-        const totalAssetsRequested = blocks.reduce((sum, b) => sum + (b.num_assets_requested || 0), 0);
-        const totalAssetsDownloaded = blocks.reduce((sum, b) => sum + (b.num_assets_downloaded || 0), 0);
-        const totalDuration = blocks.reduce((sum, b) => sum + (b.duration_ms || 0), 0);
+        let totalAssetsRequested = 0;
+        let totalAssetsDownloaded = 0;
+        let totalDuration = 0;
+        for (const b of blocks) {
+            totalAssetsRequested += b.num_assets_requested || 0;
+            totalAssetsDownloaded += b.num_assets_downloaded || 0;
+            totalDuration += b.duration_ms || 0;
+        }
         const successRate = totalAssetsRequested > 0 ? ((totalAssetsDownloaded / totalAssetsRequested) * 100).toFixed(1) : 0;
         
         const tableContent = templates.scrollableTable({
@@ -61,8 +61,12 @@ function renderFolderRow(folder, index) {
 export function displayFolderAnalysisTable(folders, title) {
     const tablesDiv = document.getElementById('tables');
 
-    const totalTime = folders.reduce((sum, f) => sum + f.total_time_ms, 0);
-    const totalAssets = folders.reduce((sum, f) => sum + f.asset_count, 0);
+    let totalTime = 0;
+    let totalAssets = 0;
+    for (const f of folders) {
+        totalTime += f.total_time_ms;
+        totalAssets += f.asset_count;
+    }
     const avgTimePerFolder = folders.length > 0 ? totalTime / folders.length : 0;
 
     const tableContent = templates.scrollableTable({
@@ -55,10 +55,10 @@ class APIClient {
     }
 
     // Convenience methods for common endpoints
-    async getLogs() {
+    async getLogs(limit = null) {
         try {
             const db = await this.getDatabase();
-            return await db.getLogs();
+            return await db.getLogs(limit);
         } catch (error) {
             console.error('Error getting logs:', error);
             // Return empty array if database doesn't exist yet
@@ -66,6 +66,17 @@ class APIClient {
         }
     }
 
+    async getLogMetadata(logId = this.currentLogId) {
+        try {
+            const db = await this.getDatabase();
+            return await db.getLogMetadata(logId);
+        } catch (error) {
+            console.error('Error getting log metadata:', error);
+            // Return null if database doesn't exist yet
+            return null;
+        }
+    }
+
     async getSummary() {
         try {
             const db = await this.getDatabase();
@@ -78,8 +89,8 @@ class APIClient {
 
     async getTimeline() {
         try {
-            // Force a fresh database connection to ensure we get the latest data
-            this.db = null;
+            // Reuse the cached connection - IndexedDB reads always see committed data,
+            // and getDatabase() already reconnects when a new parse bumps the version
             const db = await this.getDatabase();
             return await db.getTimeline(this.currentLogId);
         } catch (error) {
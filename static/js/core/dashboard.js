@@ -307,8 +307,9 @@ async function loadExampleLog(logId) {
             throw new Error(`Failed to fetch ${config.path}: ${response.statusText}`);
         }
 
-        const content = await response.text();
-        const blob = new Blob([content], { type: 'text/plain' });
+        // Wrap the response bytes directly - decoding to a string and re-encoding
+        // would copy the whole log twice
+        const blob = await response.blob();
         const file = new File([blob], config.displayName, { type: 'text/plain' });
 
         // Open the log parser modal
@@ -356,7 +357,8 @@ async function loadLogList() {
         // Clear dashboard first to prevent showing stale data
         clearDashboard();
         
-        const logs = await window.apiClient.getLogs();
+        // Only the most recent log is shown
+        const logs = await window.apiClient.getLogs(1);
         
         if (logs.length === 0) {
             // Show empty state - user can upload a file
@@ -6,6 +6,7 @@
 // Database version counter - stored in localStorage
 const DB_VERSION_KEY = 'unity_log_db_version';
 const DB_NAME_PREFIX = 'UnityLogAnalyzer';
+const DB_NAME_PATTERN = new RegExp(`^${DB_NAME_PREFIX}_v(\\d+)$`);
 
 // ─────────────────────────────────────────────────────────────────────────────
 // VERSION MANAGEMENT
@@ -51,10 +52,9 @@ async function syncDatabaseVersion() {
     if (indexedDB.databases) {
         try {
             const databases = await indexedDB.databases();
-            const dbNamePattern = new RegExp(`^${DB_NAME_PREFIX}_v(\\d+)$`);
 
             for (const dbInfo of databases) {
-                const match = dbInfo.name.match(dbNamePattern);
+                const match = dbInfo.name.match(DB_NAME_PATTERN);
                 if (match) {
                     const dbVersion = parseInt(match[1], 10);
                     if (dbVersion > highestVersion) {
@@ -92,6 +92,16 @@ const DATABASE_SCHEMA = {
     worker_thread_phases: '++id, worker_thread_id, start_timestamp, end_timestamp, duration_ms, import_count, start_line_number, [worker_thread_id+start_timestamp]'
 };
 
+/**
+ * Connection options
+ * Relaxed durability lets Chrome commit write transactions without waiting
+ * for a disk flush. The database is rebuilt from the log on every parse, so
+ * losing the final transaction on a crash is acceptable.
+ */
+const DATABASE_OPTIONS = {
+    chromeTransactionDurability: 'relaxed'
+};
+
 // ─────────────────────────────────────────────────────────────────────────────
 // DATABASE CLASS
 // ─────────────────────────────────────────────────────────────────────────────
@@ -109,7 +119,7 @@ class UnityLogDatabaseCore {
     }
 
     _initDatabase() {
-        this.db = new Dexie(this.dbName);
+        this.db = new Dexie(this.dbName, DATABASE_OPTIONS);
         this.db.version(1).stores(DATABASE_SCHEMA);
     }
 
@@ -173,9 +183,17 @@ class UnityLogDatabaseCore {
     // METADATA OPERATIONS
     // ─────────────────────────────────────────────────────────────────────────
 
-    async getLogs() {
+    /**
+     * Get logs, most recently parsed first
+     * @param {number|null} limit - Optional cap on the number of logs returned
+     */
+    async getLogs(limit = null) {
         await this.open();
-        const logs = await this.db.log_metadata.orderBy('date_parsed').reverse().toArray();
+        let collection = this.db.log_metadata.orderBy('date_parsed').reverse();
+        if (limit) {
+            collection = collection.limit(limit);
+        }
+        const logs = await collection.toArray();
         return logs.map(log => ({
             ...log,
             date_parsed: log.date_parsed || new Date().toISOString()
@@ -194,7 +212,12 @@ class UnityLogDatabaseCore {
 
     async setLiveMonitoring(logId, isMonitoring) {
         await this.open();
-        await this.db.log_metadata.update(logId, { is_live_monitoring: isMonitoring });
+        const update = { is_live_monitoring: isMonitoring };
+        if (isMonitoring) {
+            // Live polling adds rows, so aggregates stored at parse time no longer apply
+            update.summary_aggregates = null;
+        }
+        await this.db.log_metadata.update(logId, update);
     }
 
     async updateLastProcessedLine(logId, lineNumber) {
@@ -324,10 +347,9 @@ async function cleanupOldDatabases(currentVersion) {
     if (indexedDB.databases) {
         try {
             const databases = await indexedDB.databases();
-            const dbNamePattern = new RegExp(`^${DB_NAME_PREFIX}_v(\\d+)$`);
 
             for (const dbInfo of databases) {
-                const match = dbInfo.name.match(dbNamePattern);
+                const match = dbInfo.name.match(DB_NAME_PATTERN);
                 if (match) {
                     const dbVersion = parseInt(match[1], 10);
                     if (dbVersion !== currentVersion) {
@@ -4,7 +4,24 @@
  */
 
 // Code version patch number - increment when making changes to byte offset calculation or log viewing logic
-const LOG_VIEWER_VERSION_PATCH = 3;
+const LOG_VIEWER_VERSION_PATCH = 9;
+
+// Patterns used for every displayed line, compiled once
+const LINE_BREAK_PATTERN = /\r?\n/;
+const LINE_TIMESTAMP_PATTERN = /^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)\|/;
+
+// Bytes read per step when seeking to or reading a page of lines
+const LINE_READ_CHUNK_SIZE = 64 * 1024;
+
+// Bytes read when checking that a stored byte offset still points at its line
+const LINE_CHECK_READ_SIZE = 4096;
+
+// Lines already read from the file watcher: { endPosition, lines }
+// Keyed by database name, log ID and file, since log IDs restart at 1 in every new database
+const fileWatcherLineCache = new Map();
+
+// Only the log being watched is worth keeping; older entries are evicted first
+const MAX_FILE_WATCHER_CACHE_ENTRIES = 2;
 
 class LogLinesQuery {
     constructor(db, logId) {
@@ -12,6 +29,20 @@ class LogLinesQuery {
         this.logId = logId;
     }
 
+    /**
+     * Drop cached file watcher lines for a log, called when monitoring starts or stops
+     * @param {string} dbName - Name of the database the log belongs to
+     * @param {number} logId - Log ID within that database
+     */
+    static clearFileWatcherCache(dbName, logId) {
+        const prefix = `${dbName}:${logId}:`;
+        for (const key of fileWatcherLineCache.keys()) {
+            if (key.startsWith(prefix)) {
+                fileWatcherLineCache.delete(key);
+            }
+        }
+    }
+
     /**
      * Query log lines with various options
      * Now reads directly from file blob using line index
@@ -37,7 +68,7 @@ class LogLinesQuery {
         
         // For live monitoring, read from file watcher service instead of memory cache
         if (isLiveMonitoring && window.liveMonitor) {
-            return await this._queryFromFileWatcher(options, totalLines);
+            return await this._queryFromFileWatcher(options, totalLines, metadata.log_file);
         }
         
         // Get file from memory cache
@@ -112,21 +143,23 @@ class LogLinesQuery {
         // Try to find byte_offset from asset_imports or operations for the center line
         await this.db.open();
         let centerByteOffset = null;
+        let expectedText = null; // Text the stored line must contain, when the row records it
         let sourceType = null; // Track where the byte_offset came from for debugging
         
-        // Check asset_imports first
+        // Look the line up through each table's line_number index, asset_imports first
         const assetImport = await this.db.asset_imports
-            .filter(ai => ai.line_number === center_line)
+            .where('line_number').equals(center_line)
             .first();
         
         if (assetImport && assetImport.byte_offset !== null && assetImport.byte_offset !== undefined) {
             centerByteOffset = assetImport.byte_offset;
+            expectedText = this._lineCheckText(assetImport);
             sourceType = 'asset_import';
             console.log(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] Found byte_offset ${centerByteOffset} from asset_import for line ${center_line}`);
         } else {
             // Check processes
             const operation = await this.db.processes
-                .filter(op => op.line_number === center_line)
+                .where('line_number').equals(center_line)
                 .first();
             
             if (operation && operation.byte_offset !== null && operation.byte_offset !== undefined) {
@@ -136,7 +169,7 @@ class LogLinesQuery {
             } else {
                 // Check cache_server_download_blocks
                 const cacheBlock = await this.db.cache_server_download_blocks
-                    .filter(block => block.line_number === center_line)
+                    .where('line_number').equals(center_line)
                     .first();
                 
                 if (cacheBlock && cacheBlock.byte_offset !== null && cacheBlock.byte_offset !== undefined) {
@@ -147,64 +180,42 @@ class LogLinesQuery {
             }
         }
         
+        // Line whose start centerByteOffset points at
+        let actualLineNumber = center_line;
+
+        // A stale offset (e.g. a live log that was truncated) would silently show the wrong lines
+        if (centerByteOffset !== null && !(await this._isLineAt(file, centerByteOffset, expectedText))) {
+            console.error(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] CRITICAL: Byte offset ${centerByteOffset} from ${sourceType} does not point at line ${center_line}, seeking instead`);
+            centerByteOffset = null;
+        }
+
         if (centerByteOffset === null) {
-            // Fallback: estimate byte offset based on line number (rough approximation)
-            // For ASCII files, average ~80 bytes per line
-            centerByteOffset = center_line * 80;
-            sourceType = 'estimated';
-            console.log(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] No byte_offset found in database, using estimated ${centerByteOffset} for line ${center_line}`);
+            // No usable stored offset for this line - seek to it from the nearest line that has one
+            const anchor = await this._findLineAnchor(clampedCenterLine, file);
+            centerByteOffset = await this._seekLine(file, anchor, clampedCenterLine);
+            actualLineNumber = clampedCenterLine;
+            sourceType = 'seek';
+            console.log(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] No byte_offset found in database, seeked from line ${anchor.lineNumber} to byte ${centerByteOffset} for line ${clampedCenterLine}`);
         }
         
-        // Count newlines from start of file to centerByteOffset to find exact line number
+        // Read only a window around centerByteOffset
         const bytesPerLine = 200; // Conservative estimate for reading chunk size
         const readBeforeBytes = Math.max(0, centerByteOffset - (contextSize * bytesPerLine * 3)); // Read plenty before
         const readAfterBytes = centerByteOffset + (contextSize * bytesPerLine * 3) + 20480; // 20KB buffer after
         
-        // Read from start of file to centerByteOffset to count newlines accurately
-        // This tells us the exact line number at centerByteOffset
-        const beforeSlice = file.slice(0, centerByteOffset);
-        const beforeArrayBuffer = await beforeSlice.arrayBuffer();
+        const displayBytes = new Uint8Array(await file.slice(readBeforeBytes, readAfterBytes).arrayBuffer());
         const decoder = new TextDecoder('utf-8');
-        const beforeText = decoder.decode(beforeArrayBuffer);
-        
-        // Count newlines from start of file to centerByteOffset
-        // This gives us the line number (1-based) that starts at centerByteOffset
-        const newlinesCount = (beforeText.match(/\r?\n/g) || []).length;
-        const actualLineNumber = newlinesCount + 1; // +1 because line numbers are 1-based
-        
-        // Verify: actualLineNumber should equal center_line (from asset_import)
-        if (actualLineNumber !== center_line) {
-            console.error(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] CRITICAL: Byte offset ${centerByteOffset} points to line ${actualLineNumber}, but ${sourceType} says ${center_line}. This indicates the byte offset was stored incorrectly during parsing.`);
-            console.error(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] The byte offset calculation during parsing may be wrong. Using actual line number ${actualLineNumber} instead of ${center_line}.`);
-            console.error(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] Source: ${sourceType}, centerByteOffset: ${centerByteOffset}`);
-            // Use the actual line number from byte offset - it's more accurate
-            // Update center_line to match what the byte offset actually points to
-            const correctedCenterLine = actualLineNumber;
-            // Use actualLineNumber for targetLineIndex calculation since byte offset is authoritative
-        }
+        const displayText = decoder.decode(displayBytes);
+        const allLines = displayText.split(LINE_BREAK_PATTERN);
+        const newlinesToCenter = this._countNewlines(displayBytes, centerByteOffset - readBeforeBytes);
         
-        // Now read the chunk for display (around centerByteOffset)
-        const displaySlice = file.slice(readBeforeBytes, readAfterBytes);
-        const displayArrayBuffer = await displaySlice.arrayBuffer();
-        const displayText = decoder.decode(displayArrayBuffer);
-        const allLines = displayText.split(/\r?\n/);
-        
-        // Count newlines from start of file to readBeforeBytes to find what line number the chunk starts at
-        const beforeDisplaySlice = file.slice(0, readBeforeBytes);
-        const beforeDisplayArrayBuffer = await beforeDisplaySlice.arrayBuffer();
-        const beforeDisplayText = decoder.decode(beforeDisplayArrayBuffer);
-        const newlinesBeforeDisplay = (beforeDisplayText.match(/\r?\n/g) || []).length;
-        const chunkStartLineNumber = newlinesBeforeDisplay + 1; // +1 because line numbers are 1-based
+        // centerByteOffset is always the start of actualLineNumber, so line numbers
+        // can be derived from the window alone without scanning from start of file
+        const chunkStartLineNumber = actualLineNumber - newlinesToCenter;
         
         // The line at centerByteOffset should be at index in allLines
-        // Use actualLineNumber (from byte offset) as it's more accurate than center_line (from database)
         let targetLineIndex = actualLineNumber - chunkStartLineNumber;
         
-        // If there's a mismatch, log it but use the actual line number
-        if (actualLineNumber !== center_line) {
-            console.warn(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] Using line ${actualLineNumber} (from byte offset) instead of ${center_line} (from database)`);
-        }
-        
         // Clamp targetLineIndex to valid range
         if (targetLineIndex < 0) {
             console.warn(`[LogViewer v${LOG_VIEWER_VERSION_PATCH}] targetLineIndex ${targetLineIndex} < 0, adjusting to 0`);
@@ -261,58 +272,51 @@ class LogLinesQuery {
         };
     }
 
+    /**
+     * Count '\n' bytes in the first `end` bytes of a buffer
+     * Matches the /\r?\n/ line splitting used for display
+     */
+    _countNewlines(bytes, end) {
+        const limit = Math.min(end, bytes.length);
+        let count = 0;
+        for (let i = 0; i < limit; i++) {
+            if (bytes[i] === 0x0A) count++;
+        }
+        return count;
+    }
+
     /**
      * Query with pagination
-     * Reads lines directly from file by estimating byte positions
+     * Seeks to the first requested line from the nearest known line start
+     * instead of counting every line from the beginning of the file
      */
     async _queryPaginated(offset, limit, totalLines, file) {
         const startLine = offset + 1; // Line numbers are 1-based
         const endLine = Math.min(offset + limit, totalLines);
-        
-        // Estimate byte positions based on average line length
-        // For most log files, average line is around 100-200 bytes
-        const avgBytesPerLine = 150;
-        const estimatedStartByte = (startLine - 1) * avgBytesPerLine;
-        const estimatedEndByte = endLine * avgBytesPerLine + 10240; // Add buffer
-        
-        // Read a chunk from the file
-        const fileSlice = file.slice(Math.max(0, estimatedStartByte), Math.min(file.size, estimatedEndByte));
-        const arrayBuffer = await fileSlice.arrayBuffer();
+
+        const anchor = await this._findLineAnchor(startLine, file);
+        const startByte = await this._seekLine(file, anchor, startLine);
+        const pageBytes = await this._readLineBytes(file, startByte, endLine - startLine + 1);
+
         const decoder = new TextDecoder('utf-8');
-        const fileText = decoder.decode(arrayBuffer);
-        
-        // Count newlines from start of file to estimatedStartByte to find actual starting line
-        const beforeSlice = file.slice(0, Math.max(0, estimatedStartByte));
-        const beforeArrayBuffer = await beforeSlice.arrayBuffer();
-        const beforeText = decoder.decode(beforeArrayBuffer);
-        const newlinesBeforeStart = (beforeText.match(/\r?\n/g) || []).length;
-        const actualStartLine = newlinesBeforeStart + 1;
-        
-        // Split into lines
-        const allLines = fileText.split(/\r?\n/);
-        
-        // Calculate which lines in allLines correspond to our requested range
+        const pageLines = decoder.decode(pageBytes).split(LINE_BREAK_PATTERN);
+
         const lines = [];
-        const startIndex = Math.max(0, startLine - actualStartLine);
-        const endIndex = Math.min(allLines.length, endLine - actualStartLine + 1);
-        
-        let currentLineNumber = actualStartLine + startIndex;
-        
-        for (let i = startIndex; i < endIndex && currentLineNumber <= endLine; i++) {
-            if (i < allLines.length) {
-                const lineContent = allLines[i];
-                const parsedLine = this._parseLine(lineContent, currentLineNumber);
-                
-                lines.push({
-                    line_number: currentLineNumber,
-                    content: lineContent,
-                    line_type: parsedLine.lineType,
-                    timestamp: parsedLine.timestamp
-                });
-                currentLineNumber++;
-            }
+        let currentLineNumber = startLine;
+
+        for (let i = 0; i < pageLines.length && currentLineNumber <= endLine; i++) {
+            const lineContent = pageLines[i];
+            const parsedLine = this._parseLine(lineContent, currentLineNumber);
+
+            lines.push({
+                line_number: currentLineNumber,
+                content: lineContent,
+                line_type: parsedLine.lineType,
+                timestamp: parsedLine.timestamp
+            });
+            currentLineNumber++;
         }
-        
+
         return {
             lines: lines,
             total_lines: totalLines,
@@ -322,6 +326,127 @@ class LogLinesQuery {
         };
     }
 
+    /**
+     * Find the closest line at or before targetLine whose byte offset is stored
+     * Asset imports record the byte offset of their line, so they act as seek points.
+     * An anchor that no longer matches the file falls back to the start of the file
+     * @returns {Promise<{lineNumber: number, byteOffset: number}>}
+     */
+    async _findLineAnchor(targetLine, file) {
+        await this.db.open();
+        let searchLine = targetLine;
+
+        // Step back past anchors that fail the check; only when none passes (a truncated
+        // or replaced file) does the seek start from the beginning of the file
+        while (searchLine >= 1) {
+            const assetImport = await this.db.asset_imports
+                .where('line_number').belowOrEqual(searchLine)
+                .reverse()
+                .filter(ai => ai.byte_offset !== null && ai.byte_offset !== undefined && ai.byte_offset < file.size)
+                .first();
+
+            if (!assetImport) break;
+
+            if (await this._isLineAt(file, assetImport.byte_offset, this._lineCheckText(assetImport))) {
+                return { lineNumber: assetImport.line_number, byteOffset: assetImport.byte_offset };
+            }
+            searchLine = assetImport.line_number - 1;
+        }
+        return { lineNumber: 1, byteOffset: 0 };
+    }
+
+    /**
+     * Text an asset import's stored line is known to contain, or null if the row's path
+     * isn't taken from that line. Sprite atlases started by "Generating Atlas Masks" store a
+     * synthesized SpriteAtlas/<name> path against the "Sprite Atlas Operation" line
+     */
+    _lineCheckText(assetImport) {
+        return assetImport.importer_type === 'SpriteAtlasImporter' ? null : assetImport.asset_path;
+    }
+
+    /**
+     * Cheap check that byteOffset is the start of a line in the file and, when given,
+     * that the line contains expectedText. Reads only a few KB around the offset; a line
+     * running past that window is accepted on its line start alone
+     */
+    async _isLineAt(file, byteOffset, expectedText = null) {
+        if (byteOffset < 0 || byteOffset >= file.size) {
+            return false;
+        }
+
+        const readStart = Math.max(0, byteOffset - 1);
+        const bytes = new Uint8Array(await file.slice(readStart, byteOffset + LINE_CHECK_READ_SIZE).arrayBuffer());
+        if (byteOffset > 0 && bytes[0] !== 0x0A) {
+            return false;
+        }
+        if (!expectedText) {
+            return true;
+        }
+
+        const lineStart = byteOffset - readStart;
+        let lineEnd = bytes.indexOf(0x0A, lineStart);
+        if (lineEnd === -1) {
+            // The line continues past the window, so expectedText may lie beyond it
+            if (byteOffset + LINE_CHECK_READ_SIZE < file.size) {
+                return true;
+            }
+            lineEnd = bytes.length;
+        }
+        return new TextDecoder('utf-8').decode(bytes.subarray(lineStart, lineEnd)).includes(expectedText);
+    }
+
+    /**
+     * Scan forward from an anchor to the byte offset where targetLine starts
+     */
+    async _seekLine(file, anchor, targetLine) {
+        let lineNumber = anchor.lineNumber;
+        let position = anchor.byteOffset;
+
+        while (lineNumber < targetLine && position < file.size) {
+            const chunk = new Uint8Array(await file.slice(position, position + LINE_READ_CHUNK_SIZE).arrayBuffer());
+            for (let i = 0; i < chunk.length; i++) {
+                if (chunk[i] === 0x0A && ++lineNumber === targetLine) {
+                    return position + i + 1;
+                }
+            }
+            position += chunk.length;
+        }
+
+        return position;
+    }
+
+    /**
+     * Read bytes from startByte through the end of the lineCount-th line (or end of file)
+     */
+    async _readLineBytes(file, startByte, lineCount) {
+        const chunks = [];
+        let totalLength = 0;
+        let newlines = 0;
+        let position = startByte;
+
+        while (newlines < lineCount && position < file.size) {
+            const chunk = new Uint8Array(await file.slice(position, position + LINE_READ_CHUNK_SIZE).arrayBuffer());
+            let end = chunk.length;
+            for (let i = 0; i < chunk.length; i++) {
+                if (chunk[i] === 0x0A && ++newlines === lineCount) {
+                    end = i + 1;
+                    break;
+                }
+            }
+            chunks.push(chunk.subarray(0, end));
+            totalLength += end;
+            position += chunk.length;
+        }
+
+        const bytes = new Uint8Array(totalLength);
+        let written = 0;
+        for (const chunk of chunks) {
+            bytes.set(chunk, written);
+            written += chunk.length;
+        }
+        return bytes;
+    }
+
     /**
      * Parse a line to extract timestamp and classify line type
      */
@@ -330,7 +455,7 @@ class LogLinesQuery {
         let timestamp = null;
         let contentLine = line;
         
-        const timestampMatch = line.match(/^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)\|/);
+        const timestampMatch = line.match(LINE_TIMESTAMP_PATTERN);
         if (timestampMatch) {
             timestamp = timestampMatch[1];
             contentLine = line.substring(timestampMatch[0].length);
@@ -351,10 +476,59 @@ class LogLinesQuery {
         };
     }
 
+    /**
+     * Get all lines of the live log, reading only what was appended since the last call
+     * The last cached line may be partial, so it is re-split together with the new content
+     * @param {string} logFile - Watched file name, part of the cache key
+     */
+    async _readFileWatcherLines(logFile) {
+        const cacheKey = `${this.db.name}:${this.logId}:${logFile || ''}`;
+        const cached = fileWatcherLineCache.get(cacheKey);
+        const start = cached?.endPosition ?? 0;
+
+        const readUrl = window.liveMonitor._getFileWatcherUrl(`/read?start=${start}`);
+        if (!readUrl) {
+            throw new Error('File watcher service not available');
+        }
+
+        const response = await fetch(readUrl);
+        const data = await response.json();
+
+        if (data.error) {
+            throw new Error(data.error);
+        }
+
+        // Full read (first call or file reset): the content is the whole file
+        if (!cached || data.file_reset) {
+            if (!data.content) {
+                throw new Error('No file content received from file watcher');
+            }
+            const lines = data.content.split(LINE_BREAK_PATTERN);
+            if (data.end_position !== undefined) {
+                fileWatcherLineCache.delete(cacheKey);
+                while (fileWatcherLineCache.size >= MAX_FILE_WATCHER_CACHE_ENTRIES) {
+                    fileWatcherLineCache.delete(fileWatcherLineCache.keys().next().value);
+                }
+                fileWatcherLineCache.set(cacheKey, { endPosition: data.end_position, lines });
+            }
+            return lines;
+        }
+
+        if (data.content) {
+            const tail = cached.lines.pop();
+            for (const line of (tail + data.content).split(LINE_BREAK_PATTERN)) {
+                cached.lines.push(line);
+            }
+            cached.endPosition = data.end_position;
+        }
+
+        return cached.lines;
+    }
+
     /**
      * Query log lines from file watcher service (for live monitoring)
      */
-    async _queryFromFileWatcher(options, totalLines) {
+    async _queryFromFileWatcher(options, totalLines, logFile) {
         const {
             center_line,
             offset = 0,
@@ -365,25 +539,8 @@ class LogLinesQuery {
             throw new Error('Live monitor not available');
         }
 
-        const readUrl = window.liveMonitor._getFileWatcherUrl('/read?start=0');
-        if (!readUrl) {
-            throw new Error('File watcher service not available');
-        }
-
         try {
-            const response = await fetch(readUrl);
-            const data = await response.json();
-            
-            if (data.error) {
-                throw new Error(data.error);
-            }
-
-            if (!data.content) {
-                throw new Error('No file content received from file watcher');
-            }
-
-            // Parse the file content
-            const allLines = data.content.split(/\r?\n/);
+            const allLines = await this._readFileWatcherLines(logFile);
             const actualTotalLines = allLines.length;
 
             // For center_line queries, return context around the line
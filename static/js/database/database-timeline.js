@@ -3,6 +3,9 @@
  * Orchestrates timeline construction using specialized builders
  */
 
+// Built timelines, keyed by database name and log ID: { signature, timeline }
+const builtTimelines = new Map();
+
 class TimelineBuilder {
     constructor(db, logId) {
         this.db = db;
@@ -11,13 +14,62 @@ class TimelineBuilder {
 
     /**
      * Build timeline data for visualization
+     * Reuses the previous build while the rows and metadata it was built from are unchanged.
+     * Live logs are cached too, except while their bounds still come from the clock
+     * (no timestamps yet), since those move on every build.
      */
     async build() {
+        const cacheKey = `${this.db.name}:${this.logId}`;
+        const signature = await this._getDataSignature();
+        const cached = builtTimelines.get(cacheKey);
+        if (signature && cached?.signature === signature) {
+            return cached.timeline;
+        }
+
+        const { timeline, boundsFromClock } = await this._buildTimeline();
+        if (signature && !boundsFromClock) {
+            builtTimelines.set(cacheKey, { signature, timeline });
+        } else {
+            builtTimelines.delete(cacheKey);
+        }
+        return timeline;
+    }
+
+    /**
+     * Describe the data a timeline is built from
+     * Rows are only ever appended (live monitoring included), so row counts plus the
+     * metadata the positioner reads identify the build. Polls that add no events reuse it.
+     */
+    async _getDataSignature() {
+        const [metadata, imports, operations, cacheServerBlocks, workerPhases] = await Promise.all([
+            this.db.log_metadata.get(this.logId),
+            this.db.asset_imports.count(),
+            this.db.processes.count(),
+            this.db.cache_server_download_blocks.count(),
+            this.db.worker_thread_phases.count()
+        ]);
+
+        if (!metadata) {
+            return null;
+        }
+
+        return JSON.stringify([
+            metadata.start_timestamp, metadata.end_timestamp, metadata.total_lines,
+            imports, operations, cacheServerBlocks, workerPhases
+        ]);
+    }
+
+    /**
+     * Build the timeline from the database
+     * @returns {Promise<{timeline: Object, boundsFromClock: boolean}>} The timeline, and whether
+     *          its bounds fell back to the current time
+     */
+    async _buildTimeline() {
         // Fetch all required data
         const { metadata, imports, operations, cacheServerBlocks, workerPhases } = await this._fetchData();
 
         // Determine timestamp bounds
-        const { firstTimestamp, lastTimestamp } = this._getTimestampBounds(metadata, imports, operations, cacheServerBlocks);
+        const { firstTimestamp, lastTimestamp, boundsFromClock } = this._getTimestampBounds(metadata, imports, operations, cacheServerBlocks);
 
         // Create positioner for consistent positioning logic
         const positioner = new TimelinePositioner(metadata, firstTimestamp, lastTimestamp);
@@ -38,8 +90,8 @@ class TimelineBuilder {
         const operationSegments = operationBuilder.build(events);
         const cacheBlockSegments = cacheBlockBuilder.build(cacheServerBlocks);
 
-        // Combine all segments
-        let segments = [...importSegments, ...operationSegments, ...cacheBlockSegments];
+        // Combine all segments (concat sizes the result once rather than growing it element by element)
+        const segments = importSegments.concat(operationSegments, cacheBlockSegments);
         segments.sort((a, b) => a.start_time - b.start_time);
 
         // Calculate final total time
@@ -51,7 +103,7 @@ class TimelineBuilder {
         // Calculate actual asset import time
         const actualAssetImportTime = imports.reduce((sum, imp) => sum + (imp.import_time_ms || 0), 0);
 
-        return {
+        const timeline = {
             total_time_ms: totalTimeMs,
             segments: segments,
             summary: {
@@ -62,17 +114,24 @@ class TimelineBuilder {
             last_timestamp: lastTimestamp,
             worker_threads: workerThreadData
         };
+
+        return { timeline, boundsFromClock };
     }
 
     /**
      * Fetch all required data from database
      */
     async _fetchData() {
-        const metadata = await this.db.log_metadata.get(this.logId);
-        const imports = await this.db.asset_imports.toCollection().sortBy('line_number');
-        const operations = await this.db.processes.toCollection().sortBy('line_number');
-        const cacheServerBlocks = await this.db.cache_server_download_blocks.toCollection().sortBy('start_timestamp');
-        const workerPhases = await this.db.worker_thread_phases.toCollection().sortBy('start_timestamp');
+        // Tables are independent, so issue the reads together rather than one after another.
+        // Imports and processes come back in line order straight from the line_number index,
+        // ready for _mergeEvents without a sort.
+        const [metadata, imports, operations, cacheServerBlocks, workerPhases] = await Promise.all([
+            this.db.log_metadata.get(this.logId),
+            this.db.asset_imports.orderBy('line_number').toArray(),
+            this.db.processes.orderBy('line_number').toArray(),
+            this.db.cache_server_download_blocks.toCollection().sortBy('start_timestamp'),
+            this.db.worker_thread_phases.toCollection().sortBy('start_timestamp')
+        ]);
 
         return { metadata, imports, operations, cacheServerBlocks, workerPhases };
     }
@@ -85,7 +144,8 @@ class TimelineBuilder {
         if (metadata?.start_timestamp && metadata?.end_timestamp) {
             return {
                 firstTimestamp: metadata.start_timestamp,
-                lastTimestamp: metadata.end_timestamp
+                lastTimestamp: metadata.end_timestamp,
+                boundsFromClock: false
             };
         }
 
@@ -122,7 +182,8 @@ class TimelineBuilder {
         });
 
         // Fallback to defaults if no timestamps found
-        if (!firstTimestamp || !lastTimestamp) {
+        const boundsFromClock = !firstTimestamp || !lastTimestamp;
+        if (boundsFromClock) {
             const now = new Date();
             if (!firstTimestamp) {
                 firstTimestamp = new Date(now.getTime() - 3600000).toISOString();
@@ -132,7 +193,7 @@ class TimelineBuilder {
             }
         }
 
-        return { firstTimestamp, lastTimestamp };
+        return { firstTimestamp, lastTimestamp, boundsFromClock };
     }
 
     /**
@@ -167,16 +228,16 @@ class TimelineBuilder {
                     continue;
                 }
 
-                let startTimestamp = imp.start_timestamp;
+                const startTimestamp = imp.start_timestamp;
                 let endTimestamp = imp.end_timestamp;
+                const importTimeMs = imp.import_time_ms;
 
-                if (startTimestamp && !endTimestamp && imp.import_time_ms) {
-                    const startTime = new Date(startTimestamp).getTime();
-                    endTimestamp = new Date(startTime + imp.import_time_ms).toISOString();
+                if (startTimestamp && !endTimestamp && importTimeMs) {
+                    endTimestamp = new Date(new Date(startTimestamp).getTime() + importTimeMs).toISOString();
                 }
 
                 events.push({
-                    line_number: imp.line_number || 0,
+                    line_number: importLineNum,
                     type: 'import',
                     time_ms: imp.duration_ms || 0,
                     name: imp.asset_name || '',
@@ -188,26 +249,27 @@ class TimelineBuilder {
             } else {
                 const op = operations[operationIndex++];
 
-                let startTimestamp = op.start_timestamp;
+                const startTimestamp = op.start_timestamp;
                 let endTimestamp = op.end_timestamp;
+                const durationMs = op.duration_ms;
 
-                if (startTimestamp && !endTimestamp && op.duration_ms) {
+                // Parse the start timestamp once; it's needed for both the end fallback and time_ms
+                let timeMs = durationMs || 0;
+                if (startTimestamp) {
                     const startTime = new Date(startTimestamp).getTime();
-                    endTimestamp = new Date(startTime + op.duration_ms).toISOString();
-                }
-
-                let timeMs = op.duration_ms || 0;
-                if (startTimestamp && endTimestamp) {
-                    const startTime = new Date(startTimestamp).getTime();
-                    const endTime = new Date(endTimestamp).getTime();
-                    timeMs = endTime - startTime;
+                    if (!endTimestamp && durationMs) {
+                        endTimestamp = new Date(startTime + durationMs).toISOString();
+                    }
+                    if (endTimestamp) {
+                        timeMs = new Date(endTimestamp).getTime() - startTime;
+                    }
                 }
 
                 events.push({
-                    line_number: op.line_number || 0,
+                    line_number: operationLineNum,
                     type: 'operation',
                     time_ms: timeMs,
-                    duration_ms: op.duration_ms,
+                    duration_ms: durationMs,
                     operation_type: op.process_type || '',
                     operation_name: op.process_name || '',
                     start_timestamp: startTimestamp,
@@ -235,12 +297,20 @@ class TimelineBuilder {
         }
 
         if (totalTimeMs === 0) {
-            // Calculate from sum of all durations
-            const allDurations = [
-                ...imports.map(imp => imp.import_time_ms || 0),
-                ...operations.map(op => op.duration_ms || op.time_ms || 0)
-            ];
-            const sumDurations = allDurations.reduce((sum, d) => sum + d, 0);
+            // Sum all durations and find the line range in one pass
+            let sumDurations = 0;
+            let maxLine = -Infinity;
+            let minLine = Infinity;
+
+            const visit = (durationMs, lineNumber) => {
+                sumDurations += durationMs;
+                maxLine = Math.max(maxLine, lineNumber || 0);
+                if (lineNumber) {
+                    minLine = Math.min(minLine, lineNumber);
+                }
+            };
+            imports.forEach(imp => visit(imp.import_time_ms || 0, imp.line_number));
+            operations.forEach(op => visit(op.duration_ms || op.time_ms || 0, op.line_number));
 
             if (sumDurations > totalTimeMs) {
                 totalTimeMs = sumDurations;
@@ -248,14 +318,6 @@ class TimelineBuilder {
 
             // Line number estimation fallback
             if (totalTimeMs === 0 && (imports.length > 0 || operations.length > 0)) {
-                const maxLine = Math.max(
-                    ...imports.map(i => i.line_number || 0),
-                    ...operations.map(o => o.line_number || 0)
-                );
-                const minLine = Math.min(
-                    ...imports.filter(i => i.line_number).map(i => i.line_number),
-                    ...operations.filter(o => o.line_number).map(o => o.line_number)
-                );
                 totalTimeMs = Math.max(1000, (maxLine - minLine) * 1);
             }
 
@@ -224,11 +224,11 @@ class UnityLogDatabase extends UnityLogDatabaseCore {
                 this.db.processes
             ];
 
+            // Stream records with a cursor instead of materializing each table as an array
             for (const table of tables) {
-                const records = await table.toArray();
-                for (const record of records) {
+                await table.each(record => {
                     totalSize += this._estimateObjectSize(record);
-                }
+                });
             }
 
             // Add IndexedDB overhead (~30%)
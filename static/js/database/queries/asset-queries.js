@@ -13,8 +13,7 @@ class AssetQueries {
      * Get all assets sorted by import time descending (slowest first)
      */
     async getAll() {
-        const assets = await this.db.asset_imports.toArray();
-        return assets.sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0));
+        return await this.db.asset_imports.orderBy('import_time_ms').reverse().toArray();
     }
 
     /**
@@ -35,11 +34,11 @@ class AssetQueries {
      * @param {string} category - Asset category to filter by
      */
     async getByCategory(category) {
-        const assets = await this.db.asset_imports
+        return await this.db.asset_imports
             .where('[asset_category+import_time_ms]')
             .between([category, Dexie.minKey], [category, Dexie.maxKey])
+            .reverse()
             .toArray();
-        return assets.sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0));
     }
 
     /**
@@ -49,58 +48,72 @@ class AssetQueries {
      * @param {number|null} limit - Optional limit for pagination
      */
     async getByType(assetType, limit = null) {
-        const assets = await this.db.asset_imports
+        // Walk the index backwards so results come out slowest first
+        let collection = this.db.asset_imports
             .where('[asset_type+import_time_ms]')
             .between([assetType, Dexie.minKey], [assetType, Dexie.maxKey])
-            .toArray();
-        
-        // Sort descending (slowest first)
-        assets.sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0));
+            .reverse();
         
         if (limit !== null && limit > 0) {
-            return assets.slice(0, limit);
+            collection = collection.limit(limit);
         }
 
-        return assets;
+        return await collection.toArray();
     }
 
     /**
      * Get assets by type with progressive loading
-     * Loads all data, sorts by import_time_ms descending (slowest first),
-     * then yields sorted batches via callback for responsive UI
+     * Reads one page at a time from the index in import_time_ms descending order
+     * (slowest first) and yields each page via callback, so the first batch can
+     * render before the rest of the type has been read. Each page continues from the
+     * last [import_time_ms, id] yielded rather than an offset, so the cursor never
+     * re-walks earlier pages and rows added between pages are neither skipped nor repeated
      * @param {string} assetType - Asset type to filter by
      * @param {Function} batchCallback - Called with each batch
      * @param {number} batchSize - Size of each batch
      */
     async getByTypeProgressive(assetType, batchCallback, batchSize = 200) {
-        // Load all assets for this type
-        const allAssets = await this.db.asset_imports
+        const totalCount = await this.db.asset_imports
             .where('[asset_type+import_time_ms]')
             .between([assetType, Dexie.minKey], [assetType, Dexie.maxKey])
-            .toArray();
-
-        // Sort descending (slowest first)
-        allAssets.sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0));
+            .count();
+        const allAssets = [];
+        let lastTime = Dexie.maxKey;
+        let lastId = null;
+
+        while (true) {
+            // Equal index keys come back in descending id order, so rows sharing the
+            // last page's import time are only new if their id is lower
+            const upperTime = lastTime;
+            const upperId = lastId;
+            let page = this.db.asset_imports
+                .where('[asset_type+import_time_ms]')
+                .between([assetType, Dexie.minKey], [assetType, upperTime], true, true)
+                .reverse();
+            if (upperId !== null) {
+                page = page.filter(asset => asset.import_time_ms !== upperTime || asset.id < upperId);
+            }
 
-        const totalCount = allAssets.length;
-        let offset = 0;
+            // Read one row past the page to know whether this is the last one
+            const rows = await page.limit(batchSize + 1).toArray();
+            const isLast = rows.length <= batchSize;
+            const batch = isLast ? rows : rows.slice(0, batchSize);
 
-        // Yield sorted batches
-        while (offset < totalCount) {
-            const batch = allAssets.slice(offset, offset + batchSize);
-            
             if (batch.length === 0) break;
 
-            const isLast = (offset + batch.length) >= totalCount;
+            const offset = allAssets.length;
+            allAssets.push(...batch);
 
-            await batchCallback(batch, offset, totalCount, isLast);
+            await batchCallback(batch, offset, Math.max(totalCount, allAssets.length), isLast);
 
-            offset += batch.length;
+            if (isLast) break;
+
+            const last = batch[batch.length - 1];
+            lastTime = last.import_time_ms;
+            lastId = last.id;
 
             // Yield to event loop for UI responsiveness
-            if (!isLast) {
-                await new Promise(resolve => setTimeout(resolve, 0));
-            }
+            await new Promise(resolve => setTimeout(resolve, 0));
         }
 
         return allAssets;
@@ -125,11 +138,11 @@ class AssetQueries {
      * @param {string} importerType - Importer type to filter by
      */
     async getByImporter(importerType) {
-        const assets = await this.db.asset_imports
+        return await this.db.asset_imports
             .where('[importer_type+import_time_ms]')
             .between([importerType, Dexie.minKey], [importerType, Dexie.maxKey])
+            .reverse()
             .toArray();
-        return assets.sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0));
     }
 
     /**
@@ -137,10 +150,12 @@ class AssetQueries {
      * @param {number} limit - Number of assets to return
      */
     async getTopSlowest(limit = 20) {
-        const assets = await this.db.asset_imports.toArray();
-        return assets
-            .sort((a, b) => (b.import_time_ms || 0) - (a.import_time_ms || 0))
-            .slice(0, limit);
+        // Only the first `limit` index entries are read
+        return await this.db.asset_imports
+            .orderBy('import_time_ms')
+            .reverse()
+            .limit(limit)
+            .toArray();
     }
 
     /**
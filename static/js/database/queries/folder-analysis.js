@@ -3,6 +3,9 @@
  * Analyzes asset imports grouped by folder path.
  */
 
+// Slowest assets listed per folder
+const TOP_ASSETS_PER_FOLDER = 5;
+
 class FolderAnalysisQuery {
     constructor(db) {
         this.db = db;
@@ -11,46 +14,42 @@ class FolderAnalysisQuery {
     /**
      * Analyze assets grouped by folder
      * Groups assets into folders up to 4 levels deep
+     * Assets are streamed slowest-first from the import_time_ms index, so each
+     * folder's top assets are simply the first ones seen
      * @returns {Promise<Array>} Sorted array of folder statistics
      */
     async analyze() {
-        const assets = await this.db.asset_imports.toArray();
-
-        const folderStats = {};
+        const folderStats = new Map();
 
-        for (const asset of assets) {
+        await this.db.asset_imports.orderBy('import_time_ms').reverse().each(asset => {
             const folder = this._extractFolder(asset.asset_path);
-            
-            if (!folderStats[folder]) {
-                folderStats[folder] = {
+            const timeMs = asset.import_time_ms || 0;
+
+            let stats = folderStats.get(folder);
+            if (!stats) {
+                stats = {
                     folder: folder,
                     total_time_ms: 0,
                     asset_count: 0,
                     assets: []
                 };
+                folderStats.set(folder, stats);
             }
 
-            const timeMs = asset.import_time_ms || 0;
-            folderStats[folder].total_time_ms += timeMs;
-            folderStats[folder].asset_count++;
-            folderStats[folder].assets.push({
-                path: asset.asset_path,
-                time_ms: timeMs
-            });
-        }
+            stats.total_time_ms += timeMs;
+            stats.asset_count++;
+            if (stats.assets.length < TOP_ASSETS_PER_FOLDER) {
+                stats.assets.push({
+                    path: asset.asset_path,
+                    time_ms: timeMs
+                });
+            }
+        });
 
-        // Convert to array, calculate averages, sort assets, and limit
-        return Object.values(folderStats)
-            .map(folder => ({
-                folder: folder.folder,
-                total_time_ms: folder.total_time_ms,
-                asset_count: folder.asset_count,
-                avg_time_ms: folder.total_time_ms / folder.asset_count,
-                assets: folder.assets
-                    .sort((a, b) => b.time_ms - a.time_ms)
-                    .slice(0, 5) // Top 5 slowest assets per folder
-            }))
-            .sort((a, b) => b.total_time_ms - a.total_time_ms);
+        return Array.from(folderStats.values(), folder => ({
+            ...folder,
+            avg_time_ms: folder.total_time_ms / folder.asset_count
+        })).sort((a, b) => b.total_time_ms - a.total_time_ms);
     }
 
     /**
@@ -60,18 +59,15 @@ class FolderAnalysisQuery {
      */
     _extractFolder(path) {
         if (!path) return 'Root';
-        
-        const parts = path.split('/');
-        
-        if (parts.length >= 4) {
-            return parts.slice(0, 4).join('/');
-        } else if (parts.length >= 3) {
-            return parts.slice(0, 3).join('/');
-        } else if (parts.length >= 2) {
-            return parts.slice(0, 2).join('/');
+
+        // Cut at the 4th '/' if there is one, otherwise keep the whole path
+        let slash = -1;
+        for (let level = 0; level < 4; level++) {
+            slash = path.indexOf('/', slash + 1);
+            if (slash === -1) return path;
         }
-        
-        return parts[0] || 'Root';
+
+        return path.substring(0, slash);
     }
 }
 
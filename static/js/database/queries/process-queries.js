@@ -46,11 +46,10 @@ class ProcessQueries {
      * @param {string} processType - Type of process to filter by
      */
     async getByType(processType) {
-        const processes = await this.db.processes
-            .filter(op => op.process_type === processType)
-            .toArray();
-
-        return processes.sort((a, b) => (a.line_number || 0) - (b.line_number || 0));
+        return await this.db.processes
+            .where('process_type')
+            .equals(processType)
+            .sortBy('line_number');
     }
 }
 
@@ -11,78 +11,130 @@ class SummaryQuery {
 
     /**
      * Build complete summary statistics for a log
+     * Aggregates are computed once at the end of parsing and stored on log_metadata;
+     * live logs and databases parsed before that are aggregated on the fly
      * @returns {Promise<Object>} Summary object with all aggregated stats
      */
     async build() {
-        const [assetImports, refreshes, processes, metadata] = await Promise.all([
+        const metadata = await this.db.log_metadata.get(this.logId);
+
+        let aggregates = metadata && !metadata.is_live_monitoring ? metadata.summary_aggregates : null;
+        let refreshes = null;
+
+        if (!aggregates) {
+            const [assetImports, allRefreshes, processes] = await Promise.all([
+                this.db.asset_imports.toArray(),
+                this.db.pipeline_refreshes.toArray(),
+                this.db.processes.toArray()
+            ]);
+            refreshes = allRefreshes;
+            aggregates = this._buildAggregates(assetImports, refreshes, processes);
+        }
+
+        let projectLoadTime = metadata?.project_load_time_seconds;
+        if (projectLoadTime === undefined) {
+            refreshes = refreshes || await this.db.pipeline_refreshes.toArray();
+            projectLoadTime = this._getProjectLoadTime(refreshes);
+        }
+
+        return {
+            ...aggregates,
+            unity_version: metadata?.unity_version || null,
+            project_load_time_seconds: projectLoadTime
+        };
+    }
+
+    /**
+     * Compute the summary aggregates from the parsed tables
+     * Called by the parser once all rows are written, so build() only has to read them
+     * @returns {Promise<Object>} Asset, pipeline and script compilation aggregates
+     */
+    async computeAggregates() {
+        const [assetImports, refreshes, processes] = await Promise.all([
             this.db.asset_imports.toArray(),
             this.db.pipeline_refreshes.toArray(),
-            this.db.processes.toArray(),
-            this.db.log_metadata.get(this.logId)
+            this.db.processes.toArray()
         ]);
+        return this._buildAggregates(assetImports, refreshes, processes);
+    }
 
+    /**
+     * Combine the per-table aggregates into the stored summary shape
+     */
+    _buildAggregates(assetImports, refreshes, processes) {
         return {
-            asset_imports: this._buildAssetImportStats(assetImports),
-            by_category: this._aggregateBy(assetImports, 'asset_category', 'Other'),
-            by_type: this._aggregateBy(assetImports, 'asset_type', 'Unknown'),
-            by_importer: this._aggregateBy(assetImports, 'importer_type', 'Unknown'),
+            ...this._buildAssetAggregates(assetImports),
             pipeline_refreshes: this._buildPipelineStats(refreshes),
-            script_compilation: this._buildScriptCompilationStats(processes),
-            unity_version: metadata?.unity_version || null,
-            project_load_time_seconds: this._getProjectLoadTime(refreshes)
+            script_compilation: this._buildScriptCompilationStats(processes)
         };
     }
 
     /**
-     * Build asset import statistics
+     * Build overall asset stats and the category/type/importer breakdowns
+     * in a single pass over the asset imports
      */
-    _buildAssetImportStats(assetImports) {
+    _buildAssetAggregates(assetImports) {
         if (assetImports.length === 0) {
-            return {};
+            return { asset_imports: {}, by_category: [], by_type: [], by_importer: [] };
         }
 
-        const totalTime = assetImports.reduce((sum, a) => sum + (a.duration_ms || 0), 0);
-        const maxTime = Math.max(...assetImports.map(a => a.duration_ms || 0));
+        const byCategory = new Map();
+        const byType = new Map();
+        const byImporter = new Map();
+        let totalTime = 0;
+        let maxTime = 0;
+
+        for (const asset of assetImports) {
+            const duration = asset.duration_ms || 0;
+            totalTime += duration;
+            if (duration > maxTime) {
+                maxTime = duration;
+            }
+
+            this._addToGroup(byCategory, asset.asset_category || 'Other', duration);
+            this._addToGroup(byType, asset.asset_type || 'Unknown', duration);
+            this._addToGroup(byImporter, asset.importer_type || 'Unknown', duration);
+        }
 
         return {
-            count: assetImports.length,
-            total_time: totalTime,
-            avg_time: totalTime / assetImports.length,
-            max_time: maxTime
+            asset_imports: {
+                count: assetImports.length,
+                total_time: totalTime,
+                avg_time: totalTime / assetImports.length,
+                max_time: maxTime
+            },
+            by_category: this._groupsToRows(byCategory, 'asset_category'),
+            by_type: this._groupsToRows(byType, 'asset_type'),
+            by_importer: this._groupsToRows(byImporter, 'importer_type')
         };
     }
 
     /**
-     * Aggregate assets by a given field
-     * @param {Array} assets - Asset imports array
-     * @param {string} field - Field to group by
-     * @param {string} defaultValue - Default value for missing fields
-     * @returns {Array} Sorted array of aggregated stats
+     * Add one asset's duration to its group
      */
-    _aggregateBy(assets, field, defaultValue) {
-        if (assets.length === 0) {
-            return [];
-        }
-
-        const groups = {};
-        
-        for (const asset of assets) {
-            const key = asset[field] || defaultValue;
-            if (!groups[key]) {
-                groups[key] = { count: 0, total_time: 0 };
-            }
-            groups[key].count++;
-            groups[key].total_time += asset.duration_ms || 0;
+    _addToGroup(groups, key, duration) {
+        const group = groups.get(key);
+        if (group) {
+            group.count++;
+            group.total_time += duration;
+        } else {
+            groups.set(key, { count: 1, total_time: duration });
         }
+    }
 
-        return Object.entries(groups)
-            .map(([key, data]) => ({
-                [field]: key,
-                count: data.count,
-                total_time: data.total_time,
-                avg_time: data.total_time / data.count
-            }))
-            .sort((a, b) => b.total_time - a.total_time);
+    /**
+     * Convert grouped totals to rows sorted by total time
+     * @param {Map} groups - Group key -> { count, total_time }
+     * @param {string} field - Field name the rows are keyed by
+     * @returns {Array} Sorted array of aggregated stats
+     */
+    _groupsToRows(groups, field) {
+        return Array.from(groups, ([key, data]) => ({
+            [field]: key,
+            count: data.count,
+            total_time: data.total_time,
+            avg_time: data.total_time / data.count
+        })).sort((a, b) => b.total_time - a.total_time);
     }
 
     /**
@@ -115,6 +167,7 @@ class SummaryQuery {
 
     /**
      * Get project load time from largest pipeline refresh
+     * Fallback for databases created before the value was stored in log_metadata
      */
     _getProjectLoadTime(refreshes) {
         if (refreshes.length === 0) {
@@ -65,8 +65,8 @@ class ImportChunkBuilder {
     _finishChunk(currentChunk, chunks) {
         if (currentChunk.length === 0) return;
 
-        const chunkTime = this._calculateChunkTime(currentChunk);
         const actualImportTime = this._calculateActualImportTime(currentChunk);
+        const chunkTime = this._calculateChunkTime(currentChunk, actualImportTime);
 
         chunks.push({
             start_line: currentChunk[0].line_number,
@@ -82,8 +82,10 @@ class ImportChunkBuilder {
 
     /**
      * Calculate chunk time for timeline visualization (wall time)
+     * @param {Array} chunk - Import events in the chunk
+     * @param {number} sumDurations - Sum of the chunk's import durations
      */
-    _calculateChunkTime(chunk) {
+    _calculateChunkTime(chunk, sumDurations) {
         if (chunk.length === 0) return 0;
 
         const firstEvent = chunk[0];
@@ -94,12 +96,11 @@ class ImportChunkBuilder {
             const startTime = new Date(firstEvent.start_timestamp).getTime();
             const endTime = new Date(lastEvent.end_timestamp).getTime();
             const wallTime = endTime - startTime;
-            const sumDurations = chunk.reduce((sum, e) => sum + (e.time_ms || 0), 0);
             return Math.max(wallTime, sumDurations);
         }
 
         // Fallback to sum of durations
-        return chunk.reduce((sum, e) => sum + (e.time_ms || 0), 0);
+        return sumDurations;
     }
 
     /**
@@ -44,6 +44,9 @@ class WorkerTimelineBuilder {
             workerThreads[workerId].push(imp);
         });
 
+        // Group phases by worker once instead of rescanning them for every worker
+        const phasesByWorker = this._groupPhasesByWorker(workerPhases);
+
         // Build segments for each worker thread
         const workerTimelines = {};
 
@@ -51,7 +54,7 @@ class WorkerTimelineBuilder {
             const imports = workerThreads[workerId];
             const segments = this._buildWorkerSegments(imports, workerId, categoryColorMap);
             const groupedSegments = this._groupConsecutiveSegments(segments, workerId);
-            const phaseBlocks = this._buildPhaseBlocks(workerPhases, workerId);
+            const phaseBlocks = this._buildPhaseBlocks(phasesByWorker.get(parseInt(workerId)) || [], workerId);
 
             workerTimelines[workerId] = {
                 worker_id: workerId,
@@ -207,12 +210,30 @@ class WorkerTimelineBuilder {
         return categoryColorMap;
     }
 
+    /**
+     * Group worker phases by worker_thread_id
+     * @returns {Map} Worker thread ID -> phases in their original order
+     */
+    _groupPhasesByWorker(workerPhases) {
+        const phasesByWorker = new Map();
+        workerPhases.forEach(phase => {
+            const phases = phasesByWorker.get(phase.worker_thread_id);
+            if (phases) {
+                phases.push(phase);
+            } else {
+                phasesByWorker.set(phase.worker_thread_id, [phase]);
+            }
+        });
+        return phasesByWorker;
+    }
+
     /**
      * Build phase blocks for a worker thread
+     * @param {Array} workerPhasesForThread - Phases belonging to this worker
+     * @param {string} workerId - Worker thread ID
      */
-    _buildPhaseBlocks(workerPhases, workerId) {
+    _buildPhaseBlocks(workerPhasesForThread, workerId) {
         const phaseBlocks = [];
-        const workerPhasesForThread = workerPhases.filter(p => p.worker_thread_id === parseInt(workerId));
 
         workerPhasesForThread.forEach(phase => {
             let startTime = 0;
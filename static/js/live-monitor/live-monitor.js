@@ -104,6 +104,9 @@ export class LiveMonitor {
             timestampsEnabled: undefined
         };
 
+        // Lines cached from an earlier watch of this log ID would be appended to
+        window.LogLinesQuery?.clearFileWatcherCache(db.dbName, logId);
+
         // Set live flag
         await db.setLiveMonitoring(logId, true);
         this.ui.updateStatus(logId, true, `Watching: ${result.auto_detected ? 'Auto-detected' : ''} ${actualFilePath}`);
@@ -126,6 +129,7 @@ export class LiveMonitor {
         if (monitor) {
             clearInterval(monitor.intervalId);
             this.activeMonitors.delete(logId);
+            window.LogLinesQuery?.clearFileWatcherCache(monitor.db.dbName, logId);
             await monitor.db.setLiveMonitoring(logId, false);
             this.ui.updateStatus(logId, false);
 
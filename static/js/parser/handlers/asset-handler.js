@@ -164,7 +164,12 @@ export class AssetHandler {
     // ─────────────────────────────────────────────────────────────────────────
 
     _parseSingleLineImport(line, lineNumber, timestamp, state) {
-        let match = line.match(LogPatterns.AssetImportComplete);
+        // Both single-line formats end in "in X seconds". Multi-line starts don't, and the
+        // lazy groups in these patterns backtrack across the whole line before failing,
+        // so rule them out with plain substring checks first.
+        if (!line.includes(' seconds')) return null;
+
+        let match = line.includes('-> (artifact id:') ? line.match(LogPatterns.AssetImportComplete) : null;
 
         if (!match) {
             // Check for crunched texture format (multi-line, return null to handle separately)
@@ -20,7 +20,7 @@ export class MetadataHandler {
 
         // Start metadata collection on first line
         if (lineNumber === 1) {
-            this._initializeMetadata(metadataState, lineNumber, timestamp);
+            this._initializeMetadata(metadataState, lineNumber, state.currentLineByteOffset, timestamp);
             this._detectTimestampFormat(line, state);
         }
 
@@ -48,9 +48,10 @@ export class MetadataHandler {
     // INITIALIZATION
     // ─────────────────────────────────────────────────────────────────────────
 
-    _initializeMetadata(metadataState, lineNumber, timestamp) {
+    _initializeMetadata(metadataState, lineNumber, byteOffset, timestamp) {
         metadataState.inMetadata = true;
         metadataState.startLine = lineNumber;
+        metadataState.startByteOffset = byteOffset ?? null;
         metadataState.startTime = timestamp;
     }
 
@@ -82,13 +83,8 @@ export class MetadataHandler {
     _extractPlatform(contentLine, metadataState) {
         if (metadataState.platform) return;
 
-        if (LogPatterns.PlatformMacOS.test(contentLine)) {
-            metadataState.platform = 'macOS';
-        } else if (LogPatterns.PlatformWindows.test(contentLine)) {
-            metadataState.platform = 'Windows';
-        } else if (LogPatterns.PlatformLinux.test(contentLine)) {
-            metadataState.platform = 'Linux';
-        }
+        const match = contentLine.match(LogPatterns.Platform);
+        if (match) metadataState.platform = match[1];
     }
 
     _extractArchitecture(contentLine, metadataState) {
@@ -144,11 +140,12 @@ export class MetadataHandler {
     }
 
     _createMetadataProcess(metadataState, state, databaseOps) {
-        const { startTime, endTime, startLine } = metadataState;
+        const { startTime, endTime, startLine, startByteOffset } = metadataState;
         const durationMs = calculateDurationMs(startTime, endTime);
 
         const operation = {
             line_number: startLine,
+            byte_offset: startByteOffset,
             process_type: 'Metadata',
             process_name: 'Initialization',
             duration_seconds: durationMs / 1000,
@@ -34,6 +34,7 @@ export class PipelineHandler {
 
         pipelineRefreshState.inPipelineRefresh = true;
         pipelineRefreshState.pipelineRefreshStart = lineNumber;
+        pipelineRefreshState.pipelineRefreshByteOffset = state.currentLineByteOffset ?? null;
         pipelineRefreshState.pipelineRefreshLines = [contentLine];
         pipelineRefreshState.pipelineRefreshTimestamp = timestamp;
         return true;
@@ -59,9 +60,9 @@ export class PipelineHandler {
 
     _finalizeRefresh(state, databaseOps) {
         const { pipelineRefreshState } = state;
-        const { pipelineRefreshLines, pipelineRefreshStart, pipelineRefreshTimestamp } = pipelineRefreshState;
+        const { pipelineRefreshLines, pipelineRefreshStart, pipelineRefreshByteOffset, pipelineRefreshTimestamp } = pipelineRefreshState;
         
-        const refreshData = this._parseRefreshData(pipelineRefreshLines, pipelineRefreshStart);
+        const refreshData = this._parseRefreshData(pipelineRefreshLines, pipelineRefreshStart, pipelineRefreshByteOffset);
         if (!refreshData) {
             this._resetState(pipelineRefreshState);
             return;
@@ -74,6 +75,7 @@ export class PipelineHandler {
 
         databaseOps.addProcess({
             line_number: pipelineRefreshStart,
+            byte_offset: pipelineRefreshByteOffset,
             process_type: 'Asset Pipeline Refresh',
             process_name: refreshData.initiated_by,
             duration_seconds: refreshData.total_time_seconds,
@@ -98,7 +100,7 @@ export class PipelineHandler {
     // REFRESH DATA PARSING
     // ─────────────────────────────────────────────────────────────────────────
 
-    _parseRefreshData(lines, startLine) {
+    _parseRefreshData(lines, startLine, startByteOffset) {
         const match = lines[0].match(LogPatterns.PipelineRefreshStart);
         if (!match) return null;
 
@@ -106,6 +108,7 @@ export class PipelineHandler {
 
         return {
             line_number: startLine,
+            byte_offset: startByteOffset,
             refresh_id: refreshId,
             total_time_seconds: parseFloat(totalTime),
             initiated_by: initiatedBy
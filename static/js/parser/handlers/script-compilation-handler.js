@@ -37,7 +37,7 @@ export class ScriptCompilationHandler {
         const becauseMatch = !assemblyMatch && contentLine.match(LogPatterns.ScriptCompilationReason);
         const assemblyName = assemblyMatch?.[1] || becauseMatch?.[1]?.trim() || 'Unknown Assembly';
 
-        state.scriptCompilationState = this._createCompilationState(lineNumber, timestamp, assemblyName);
+        state.scriptCompilationState = this._createCompilationState(lineNumber, state.currentLineByteOffset, timestamp, assemblyName);
         return true;
     }
 
@@ -47,13 +47,14 @@ export class ScriptCompilationHandler {
         const rspMatch = contentLine.match(LogPatterns.ScriptCompilationBee);
         const assemblyName = rspMatch?.[1] || 'Unknown Assembly';
 
-        state.scriptCompilationState = this._createCompilationState(lineNumber, timestamp, assemblyName);
+        state.scriptCompilationState = this._createCompilationState(lineNumber, state.currentLineByteOffset, timestamp, assemblyName);
         return true;
     }
 
-    _createCompilationState(lineNumber, timestamp, assemblyName) {
+    _createCompilationState(lineNumber, byteOffset, timestamp, assemblyName) {
         return {
             start_line: lineNumber,
+            start_byte_offset: byteOffset ?? null,
             start_timestamp: timestamp,
             assembly_name: assemblyName
         };
@@ -84,6 +85,7 @@ export class ScriptCompilationHandler {
 
         databaseOps.addProcess({
             line_number: scriptCompilationState.start_line,
+            byte_offset: scriptCompilationState.start_byte_offset,
             process_type: 'Script Compilation',
             process_name: scriptCompilationState.assembly_name,
             duration_seconds: timeSeconds,
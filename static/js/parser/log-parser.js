@@ -8,7 +8,6 @@
  * - Database operations (via ParsingDatabaseOperations)
  */
 
-import { LogPatterns } from './log-patterns.js';
 import { ParserState } from './parser-state.js';
 import { readFileStreaming, formatFileSize } from './file-reader.js';
 import { WorkerThreadHandler } from './handlers/worker-thread-handler.js';
@@ -19,13 +18,46 @@ import { AcceleratorHandler } from './handlers/accelerator-handler.js';
 import { SpriteAtlasHandler } from './handlers/sprite-atlas-handler.js';
 import { MetadataHandler } from './handlers/metadata-handler.js';
 
+// Shape of the ISO timestamp that prefixes each line when -timestamps is enabled ('d' = digit)
+const TIMESTAMP_TEMPLATE = 'dddd-dd-ddTdd:dd:dd.dddZ';
+const TIMESTAMP_LENGTH = TIMESTAMP_TEMPLATE.length;
+const CHAR_0 = 48;
+const CHAR_9 = 57;
+const CHAR_D = 100;
+const CHAR_PIPE = 124;
+
+/**
+ * Check that line starts with a timestamp matching TIMESTAMP_TEMPLATE followed by '|'
+ * Same acceptance as the TimestampPrefix regex's timestamp part, in constant time
+ */
+function hasTimestampPrefix(line) {
+    if (line.charCodeAt(TIMESTAMP_LENGTH) !== CHAR_PIPE) {
+        return false;
+    }
+    for (let i = 0; i < TIMESTAMP_LENGTH; i++) {
+        const code = line.charCodeAt(i);
+        const expected = TIMESTAMP_TEMPLATE.charCodeAt(i);
+        if (expected === CHAR_D ? (code < CHAR_0 || code > CHAR_9) : code !== expected) {
+            return false;
+        }
+    }
+    return true;
+}
+
 /**
  * Main parser class - orchestrates log file parsing
  */
 class UnityLogParser {
-    constructor(db, progressCallback = null) {
+    /**
+     * @param {UnityLogDatabase} db - Database to write parsed data into
+     * @param {Function} progressCallback - Optional callback for status messages
+     * @param {Function} readProgressCallback - Optional callback for read progress: (percentRead, lineNumber) => void.
+     *                                          When omitted, read progress is reported as a status message instead.
+     */
+    constructor(db, progressCallback = null, readProgressCallback = null) {
         this.db = db;
         this.progressCallback = progressCallback;
+        this.readProgressCallback = readProgressCallback;
         this._initHandlers();
     }
 
@@ -131,9 +163,9 @@ class UnityLogParser {
         let lastProgressReport = 0;
         const PROGRESS_INTERVAL = 10000;
 
-        const onProgress = (percentRead, lineNumber) => {
+        const onProgress = this.readProgressCallback || ((percentRead, lineNumber) => {
             this._report(`Reading: ${percentRead.toFixed(1)}% (${lineNumber.toLocaleString()} lines read)`);
-        };
+        });
 
         const processLine = (line, lineNumber, byteOffset) => {
             this._parseLine(line, lineNumber, state, {
@@ -211,9 +243,18 @@ class UnityLogParser {
             return { timestamp: null, contentLine: line };
         }
 
-        const match = line.match(LogPatterns.TimestampPrefix);
-        if (match) {
-            return { timestamp: match[1], contentLine: match[2] };
+        // Prefix layout is fixed-width: "YYYY-MM-DDTHH:MM:SS.mmmZ|<thread>|<content>", so
+        // character checks replace the TimestampPrefix regex on every line. Like the regex,
+        // the thread must be non-empty and the content must not contain a line terminator
+        // that its '.' rejects ('\r', '\u2028', '\u2029')
+        if (hasTimestampPrefix(line) && line.charCodeAt(TIMESTAMP_LENGTH + 1) !== CHAR_PIPE) {
+            const contentStart = line.indexOf('|', TIMESTAMP_LENGTH + 2);
+            if (contentStart !== -1 &&
+                line.indexOf('\r', contentStart) === -1 &&
+                line.indexOf('\u2028', contentStart) === -1 &&
+                line.indexOf('\u2029', contentStart) === -1) {
+                return { timestamp: line.slice(0, TIMESTAMP_LENGTH), contentLine: line.slice(contentStart + 1) };
+            }
         }
         return { timestamp: null, contentLine: line };
     }
@@ -241,6 +282,9 @@ class UnityLogParser {
             update.end_timestamp = state.lastTimestamp;
         }
 
+        // All rows are written by now, so the summary is aggregated once here and only read afterwards
+        update.summary_aggregates = await new window.SummaryQuery(this.db.db, logId).computeAggregates();
+
         await this.db.db.log_metadata.update(logId, update);
     }
 
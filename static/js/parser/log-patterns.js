@@ -6,9 +6,7 @@ export const LogPatterns = {
     // Header / Metadata
     UnityVersion: /Unity Editor version:\s+(\S+)/,
     Architecture: /Architecture:\s+(\S+)/,
-    PlatformMacOS: /macOS version:/,
-    PlatformWindows: /Windows version:/,
-    PlatformLinux: /Linux version:/,
+    Platform: /(macOS|Windows|Linux) version:/,
     ProjectPath: /-projectpath\s+([^\s]+)/,
     ProjectPathChange: /Successfully changed project path to:\s+([^\s]+)/,
 
@@ -36,6 +34,8 @@ export const LogPatterns = {
 
     // Importer Extraction
     ImporterType: /Importer\(([^)]+)\)/,
+    HexId: /^[a-f0-9]+$/i,
+    NumericId: /^-?\d+$/,
 
     // Pipeline Refresh
     PipelineRefreshStart: /Asset Pipeline Refresh \(id=([a-f0-9]+)\): Total: ([\d.]+) seconds - Initiated by (.+?)$/,
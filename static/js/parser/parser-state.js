@@ -11,6 +11,7 @@ export class ParserState {
         this.metadataState = {
             inMetadata: false,
             startLine: null,
+            startByteOffset: null,
             endLine: null,
             startTime: null,
             endTime: null,
@@ -41,7 +42,8 @@ export class ParserState {
         this.pipelineRefreshState = {
             inPipelineRefresh: false,
             pipelineRefreshLines: [],
-            pipelineRefreshStart: 0
+            pipelineRefreshStart: 0,
+            pipelineRefreshByteOffset: null
         };
 
         // Sprite Atlas state
@@ -1,3 +1,12 @@
+// Collection key -> table name, in the order flush() writes them
+const FLUSH_TABLES = [
+    ['assetImports', 'asset_imports'],
+    ['processes', 'processes'],
+    ['pipelineRefreshes', 'pipeline_refreshes'],
+    ['acceleratorBlocks', 'cache_server_download_blocks'],
+    ['workerPhases', 'worker_thread_phases']
+];
+
 /**
  * ParsingDatabaseOperations - Centralized database operations during parsing
  * 
@@ -79,40 +88,60 @@ class ParsingDatabaseOperations {
     }
 
     /**
-     * Flush all collected data to the database immediately
-     * Used for live monitoring where we want to write after each line
+     * Keep log_metadata.project_load_time_seconds at the longest refresh seen
+     * so the summary doesn't have to derive it from every stored refresh.
+     * Expects the database to be open.
      */
-    async flush() {
-        const arrays = this.collectArrays;
-
-        if (arrays.assetImports.length > 0) {
-            await this.db.open();
-            await this.db.db.asset_imports.bulkAdd(arrays.assetImports);
-            arrays.assetImports = [];
-        }
+    async _recordProjectLoadTime(refreshes) {
+        const longest = refreshes.reduce((max, r) => Math.max(max, r.total_time_seconds || 0), 0);
 
-        if (arrays.processes.length > 0) {
-            await this.db.open();
-            await this.db.db.processes.bulkAdd(arrays.processes);
-            arrays.processes = [];
-        }
-
-        if (arrays.pipelineRefreshes.length > 0) {
-            await this.db.open();
-            await this.db.db.pipeline_refreshes.bulkAdd(arrays.pipelineRefreshes);
-            arrays.pipelineRefreshes = [];
+        const log = await this.db.db.log_metadata.toCollection().first();
+        if (log && longest > (log.project_load_time_seconds || 0)) {
+            await this.db.db.log_metadata.update(log.id, { project_load_time_seconds: longest });
         }
+    }
 
-        if (arrays.acceleratorBlocks.length > 0) {
+    /**
+     * Flush all collected data to the database immediately
+     * Used for live monitoring where we want to write after each line.
+     * Everything collected is written in a single transaction; if it fails,
+     * the rows are put back so the next flush retries them.
+     */
+    async flush() {
+        const arrays = this.collectArrays;
+        const pending = FLUSH_TABLES.filter(([key]) => arrays[key].length > 0);
+        if (pending.length === 0) return;
+
+        // Take the pending rows up front so lines added while we write go to the next flush
+        const batches = pending.map(([key, tableName]) => {
+            const rows = arrays[key];
+            arrays[key] = [];
+            return [key, tableName, rows];
+        });
+        const refreshes = batches.find(([key]) => key === 'pipelineRefreshes')?.[2];
+
+        try {
             await this.db.open();
-            await this.db.db.cache_server_download_blocks.bulkAdd(arrays.acceleratorBlocks);
-            arrays.acceleratorBlocks = [];
-        }
+            const db = this.db.db;
+            const tables = batches.map(([, tableName]) => db[tableName]);
+            if (refreshes) {
+                tables.push(db.log_metadata);
+            }
 
-        if (arrays.workerPhases.length > 0) {
-            await this.db.open();
-            await this.db.db.worker_thread_phases.bulkAdd(arrays.workerPhases);
-            arrays.workerPhases = [];
+            await db.transaction('rw', tables, async () => {
+                for (const [, tableName, rows] of batches) {
+                    await db[tableName].bulkAdd(rows);
+                }
+                if (refreshes) {
+                    await this._recordProjectLoadTime(refreshes);
+                }
+            });
+        } catch (error) {
+            // The transaction rolled back: restore the rows ahead of any collected since
+            for (const [key, , rows] of batches) {
+                arrays[key] = rows.concat(arrays[key]);
+            }
+            throw error;
         }
     }
 
@@ -160,6 +189,7 @@ class ParsingDatabaseOperations {
         if (arrays.pipelineRefreshes.length > 0) {
             this._reportProgress(`Storing ${arrays.pipelineRefreshes.length} pipeline refreshes...`);
             await this.db.bulkInsertPipelineRefreshes(arrays.pipelineRefreshes);
+            await this._recordProjectLoadTime(arrays.pipelineRefreshes);
         }
 
         // Store accelerator blocks
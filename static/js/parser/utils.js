@@ -1,5 +1,13 @@
 // Asset mappings are loaded globally via asset-mappings.js in index.html
 
+import { LogPatterns } from './log-patterns.js';
+
+// Resolve the global maps once; asset-mappings.js is a classic script, so it has
+// already run by the time this module is evaluated
+const EXT_DISPLAY_MAP = (typeof ASSET_EXT_DISPLAY_MAP !== 'undefined') ? ASSET_EXT_DISPLAY_MAP : {};
+const CATEGORY_MAP = (typeof ASSET_CATEGORY_MAP !== 'undefined') ? ASSET_CATEGORY_MAP : {};
+const IMPORTER_MAP = (typeof ASSET_IMPORTER_MAP !== 'undefined') ? ASSET_IMPORTER_MAP : {};
+
 /**
  * Parser Utilities
  * Shared helper functions for log parsing.
@@ -33,7 +41,7 @@ export function extractImporterType(importerRaw) {
     const trimmed = importerRaw.trim();
 
     // Match "Importer(...)" specifically
-    const importerMatch = trimmed.match(/Importer\(([^)]+)\)/);
+    const importerMatch = trimmed.match(LogPatterns.ImporterType);
     if (importerMatch) {
         const importerValue = importerMatch[1];
         // If it's -1 or starts with -1, it's null/unknown importer
@@ -44,7 +52,7 @@ export function extractImporterType(importerRaw) {
         const parts = importerValue.split(',');
         const importerType = parts[0].trim();
         // If it's just a GUID or numeric, it's not a valid importer type
-        if (/^[a-f0-9]+$/i.test(importerType) || /^-?\d+$/.test(importerType)) {
+        if (LogPatterns.HexId.test(importerType) || LogPatterns.NumericId.test(importerType)) {
             return null;
         }
         return importerType;
@@ -54,7 +62,7 @@ export function extractImporterType(importerRaw) {
     if (trimmed.startsWith('(') && trimmed.endsWith(')')) {
         const importerType = trimmed.slice(1, -1);
         // Validate it's not a GUID or -1
-        if (/^[a-f0-9]+$/i.test(importerType) || importerType === '-1' || /^-?\d+$/.test(importerType)) {
+        if (LogPatterns.HexId.test(importerType) || importerType === '-1' || LogPatterns.NumericId.test(importerType)) {
             return null;
         }
         return importerType;
@@ -74,12 +82,8 @@ export function categorizeAsset(path, importerType = null) {
         return { assetType: 'Folder', category: 'Folders' };
     }
 
-    // Use global maps if available (should be loaded via script tags)
-    const extMap = (typeof ASSET_EXT_DISPLAY_MAP !== 'undefined') ? ASSET_EXT_DISPLAY_MAP : {};
-    const catMap = (typeof ASSET_CATEGORY_MAP !== 'undefined') ? ASSET_CATEGORY_MAP : {};
-
-    const assetType = extMap[ext] || (ext || 'no-extension');
-    let category = catMap[ext] || 'Other';
+    const assetType = EXT_DISPLAY_MAP[ext] || (ext || 'no-extension');
+    let category = CATEGORY_MAP[ext] || 'Other';
 
     // Partial match: extensions containing 'hlsltemplate' are Shaders
     if (category === 'Other' && ext.includes('hlsltemplate')) {
@@ -172,9 +176,7 @@ export function createAssetImport({
 }) {
     // Infer importer type if missing
     if (!importerType) {
-        const ext = getExtension(assetPath);
-        const importerMap = (typeof ASSET_IMPORTER_MAP !== 'undefined') ? ASSET_IMPORTER_MAP : {};
-        importerType = importerMap[ext] || null;
+        importerType = IMPORTER_MAP[getExtension(assetPath)] || null;
     }
 
     const assetName = getFilename(assetPath);
@@ -53,9 +53,8 @@ export async function loadOverview(incremental = false) {
 
     try {
         // Get log metadata to show project name
-        const logs = await window.apiClient.getLogs();
         const currentLogId = typeof getCurrentLogId === 'function' ? getCurrentLogId() : 1;
-        const currentLog = logs.find(log => log.id === currentLogId);
+        const currentLog = await window.apiClient.getLogMetadata(currentLogId);
         if (currentLog && typeof updateProjectName === 'function') {
             updateProjectName(currentLog.project_name);
         }
@@ -106,10 +105,11 @@ export function displayStats(data) {
     }
 
     statsDiv.innerHTML = [
-        templates.statCard({ label: 'Total Project Load Time', value: formatTime(projectLoadTime) }),
+        templates.statCard({ label: 'Total Project Load Time', value: formatTime(projectLoadTime), id: 'stat-project-load-time' }),
         templates.statCard({ 
             label: 'Total Assets', 
             value: assetImports.count || 0,
+            id: 'stat-total-assets',
             clickable: true,
             onClick: 'loadAllAssets()',
             title: 'Click to view all assets'
@@ -117,6 +117,7 @@ export function displayStats(data) {
         templates.statCard({ 
             label: 'Raw Asset Import Time', 
             value: formatTime((assetImports.total_time || 0) / 1000),
+            id: 'stat-raw-import-time',
             title: 'Note this can be longer than project load time due to parallelised import worker threads'
         })
     ].join('');
@@ -139,8 +140,7 @@ export async function displayCharts(data) {
     try {
         const currentLogId = typeof getCurrentLogId === 'function' ? getCurrentLogId() : 1;
         if (currentLogId) {
-            const logs = await window.apiClient.getLogs();
-            const currentLog = logs.find(log => log.id === currentLogId);
+            const currentLog = await window.apiClient.getLogMetadata(currentLogId);
             isLiveMonitoring = currentLog?.is_live_monitoring || false;
             timestampsEnabled = currentLog?.timestampsEnabled !== false;
             
@@ -471,12 +471,18 @@ export function updateStatsIncremental(data) {
     const assetImports = data.asset_imports || {};
     const projectLoadTime = data.project_load_time_seconds || 0;
 
-    const statValues = statsDiv.querySelectorAll('.stat-value');
-    if (statValues.length >= 3) {
-        statValues[0].textContent = formatTime(projectLoadTime);
-        statValues[1].textContent = assetImports.count || 0;
-        statValues[2].textContent = formatTime((assetImports.total_time || 0) / 1000);
+    // Look up values by ID rather than scanning the stats grid by class
+    const projectLoadTimeEl = document.getElementById('stat-project-load-time');
+    const totalAssetsEl = document.getElementById('stat-total-assets');
+    const rawImportTimeEl = document.getElementById('stat-raw-import-time');
+    if (!projectLoadTimeEl || !totalAssetsEl || !rawImportTimeEl) {
+        displayStats(data);
+        return;
     }
+
+    projectLoadTimeEl.textContent = formatTime(projectLoadTime);
+    totalAssetsEl.textContent = assetImports.count || 0;
+    rawImportTimeEl.textContent = formatTime((assetImports.total_time || 0) / 1000);
 }
 
 /**